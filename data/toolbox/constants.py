@@ -198,3 +198,6 @@ def clear():
 	"""
 	_CACHE.clear()
 	_TYPE_CACHE.clear()
+
+# Constants and types come from debug symbols, which may change as objfiles are loaded
+debugger.register_cache(clear, events=('new_objfile',))
@@ -7,6 +7,7 @@ automatically loading the appropriate backend (GDB or LLDB) at runtime.
 
 import sys
 import os
+import struct
 
 # Detect which debugger we're running under
 _backend = None
@@ -59,6 +60,7 @@ Error = _backend.Error
 MemoryError = _backend.MemoryError
 
 parse_and_eval = _backend.parse_and_eval
+parse_and_eval_cached = _backend.parse_and_eval_cached
 lookup_type = _backend.lookup_type
 set_convenience_variable = _backend.set_convenience_variable
 execute = _backend.execute
@@ -71,6 +73,42 @@ create_value = _backend.create_value
 create_value_from_int = _backend.create_value_from_int
 create_value_from_address = _backend.create_value_from_address
 register = _backend.register
+register_cache = _backend.register_cache
+
+# struct format codes for unsigned integers of each size
+_UNPACK_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+def read_values(address, count, value_size):
+	"""Read a contiguous array of integer values in a single memory read.
+	
+	Args:
+		address: Memory address of the first element (as integer or pointer value)
+		count: Number of elements to read
+		value_size: Size of each element in bytes (e.g. sizeof(VALUE))
+	
+	Returns:
+		memoryview over the raw bytes, to be decoded with unpack_values()
+	
+	Raises:
+		MemoryError: If memory cannot be read
+	"""
+	return memoryview(read_memory(address, count * value_size))
+
+def unpack_values(data, value_size):
+	"""Decode raw memory into a list of unsigned integers.
+	
+	The host's byte order is used, which matches the target when debugging
+	natively (as the rest of the toolbox assumes).
+	
+	Args:
+		data: bytes or memoryview, as returned by read_values()
+		value_size: Size of each element in bytes (1, 2, 4 or 8)
+	
+	Returns:
+		List of integers, one per element
+	"""
+	code = _UNPACK_CODES[value_size]
+	return list(struct.unpack(f"={len(data) // value_size}{code}", data))
 
 # Constants
 COMMAND_DATA = _backend.COMMAND_DATA
@@ -84,6 +122,7 @@ __all__ = [
 	'Error',
 	'MemoryError',
 	'parse_and_eval',
+	'parse_and_eval_cached',
 	'lookup_type',
 	'set_convenience_variable',
 	'execute',
@@ -92,10 +131,13 @@ __all__ = [
 	'get_enum_value',
 	'read_memory',
 	'read_cstring',
+	'read_values',
+	'unpack_values',
 	'create_value',
 	'create_value_from_int',
 	'create_value_from_address',
 	'register',
+	'register_cache',
 	'COMMAND_DATA',
 	'COMMAND_USER',
 ]
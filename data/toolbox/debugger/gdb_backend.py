@@ -13,21 +13,89 @@ COMMAND_USER = gdb.COMMAND_USER
 Error = gdb.error
 MemoryError = gdb.MemoryError
 
+# GDB events which can invalidate cached state
+_CACHE_EVENTS = (
+	'cont',             # The inferior resumed
+	'stop',             # The inferior stopped
+	'memory_changed',   # Memory was written from the debugger
+	'new_objfile',      # Symbols were loaded (types and constants may change)
+	'new_inferior',     # Inferiors were added or removed
+	'inferior_deleted',
+	'before_prompt',    # The user may select another inferior or thread
+)
+
+# Cache clear functions, keyed by the name of the event which invalidates them
+_INVALIDATORS = {event_name: [] for event_name in _CACHE_EVENTS}
+
+
+def register_cache(clear_function, events=('cont', 'memory_changed', 'before_prompt')):
+	"""Register a function which clears a cache.
+	
+	By default the function is called whenever the inferior resumes or its
+	memory is changed from the debugger, since cached values of inferior state
+	may no longer be valid, and before each prompt, since the user may switch
+	to another inferior or core file. Caches of symbol information (types,
+	constants) should use events=('new_objfile',) instead.
+	
+	Args:
+		clear_function: Callable taking no arguments
+		events: Names of the events (from _CACHE_EVENTS) which invalidate the cache
+	"""
+	for event_name in events:
+		_INVALIDATORS[event_name].append(clear_function)
+
+
+def _connect_invalidators(event_name):
+	"""Connect a single listener for the event which runs its invalidators."""
+	invalidators = _INVALIDATORS[event_name]
+	
+	def invalidate(event=None):
+		for clear_function in invalidators:
+			clear_function()
+	
+	# Older versions of GDB do not have every event (e.g. new_inferior was added in GDB 8.3):
+	if hasattr(gdb.events, event_name):
+		getattr(gdb.events, event_name).connect(invalidate)
+
+
+for _event_name in _CACHE_EVENTS:
+	_connect_invalidators(_event_name)
+
+
+def _clear_caches():
+	"""Clear all registered caches of process state.
+	
+	GDB does not show a prompt between commands in batch scripts, user-defined
+	commands or gdb.execute() calls, so the selected inferior may have changed
+	without a before_prompt event.
+	"""
+	for clear_function in _INVALIDATORS['before_prompt']:
+		clear_function()
+
 
 class Value:
 	"""Wrapper for GDB values providing unified interface."""
 	
-	def __init__(self, gdb_value):
+	__slots__ = ('_value', '_addr')
+	
+	def __init__(self, gdb_value, address_hint=None):
 		"""Initialize with a GDB value.
 		
 		Args:
 			gdb_value: Native gdb.Value object
+			address_hint: Integer value of gdb_value, if already known
 		"""
 		self._value = gdb_value
+		self._addr = address_hint
 	
 	def __int__(self):
-		"""Convert value to integer."""
-		return int(self._value)
+		"""Convert value to integer.
+		
+		The result is cached, since the wrapped value does not change.
+		"""
+		if self._addr is None:
+			self._addr = int(self._value)
+		return self._addr
 	
 	def __str__(self):
 		"""Convert value to string."""
@@ -44,12 +112,7 @@ class Value:
 		Returns:
 			True if values are equal
 		"""
-		if isinstance(other, Value):
-			return int(self._value) == int(other._value)
-		elif isinstance(other, gdb.Value):
-			return int(self._value) == int(other)
-		else:
-			return int(self._value) == int(other)
+		return int(self) == int(other)
 	
 	def __hash__(self):
 		"""Return hash of value for use in sets/dicts.
@@ -57,7 +120,7 @@ class Value:
 		Returns:
 			Hash of the integer value
 		"""
-		return hash(int(self._value))
+		return hash(int(self))
 	
 	def __lt__(self, other):
 		"""Less than comparison for pointer ordering.
@@ -68,12 +131,7 @@ class Value:
 		Returns:
 			True if this value is less than other
 		"""
-		if isinstance(other, Value):
-			return int(self._value) < int(other._value)
-		elif isinstance(other, gdb.Value):
-			return int(self._value) < int(other)
-		else:
-			return int(self._value) < int(other)
+		return int(self) < int(other)
 	
 	def __le__(self, other):
 		"""Less than or equal comparison for pointer ordering.
@@ -84,12 +142,7 @@ class Value:
 		Returns:
 			True if this value is less than or equal to other
 		"""
-		if isinstance(other, Value):
-			return int(self._value) <= int(other._value)
-		elif isinstance(other, gdb.Value):
-			return int(self._value) <= int(other)
-		else:
-			return int(self._value) <= int(other)
+		return int(self) <= int(other)
 	
 	def __gt__(self, other):
 		"""Greater than comparison for pointer ordering.
@@ -100,12 +153,7 @@ class Value:
 		Returns:
 			True if this value is greater than other
 		"""
-		if isinstance(other, Value):
-			return int(self._value) > int(other._value)
-		elif isinstance(other, gdb.Value):
-			return int(self._value) > int(other)
-		else:
-			return int(self._value) > int(other)
+		return int(self) > int(other)
 	
 	def __ge__(self, other):
 		"""Greater than or equal comparison for pointer ordering.
@@ -116,12 +164,7 @@ class Value:
 		Returns:
 			True if this value is greater than or equal to other
 		"""
-		if isinstance(other, Value):
-			return int(self._value) >= int(other._value)
-		elif isinstance(other, gdb.Value):
-			return int(self._value) >= int(other)
-		else:
-			return int(self._value) >= int(other)
+		return int(self) >= int(other)
 	
 	def cast(self, type_obj):
 		"""Cast this value to a different type.
@@ -222,12 +265,7 @@ class Value:
 		Returns:
 			Integer result of subtraction
 		"""
-		if isinstance(other, Value):
-			return int(other._value) - int(self._value)
-		elif isinstance(other, gdb.Value):
-			return int(other) - int(self._value)
-		else:
-			return int(other) - int(self._value)
+		return int(other) - int(self)
 
 	
 	@property
@@ -252,6 +290,8 @@ class Value:
 class Type:
 	"""Wrapper for GDB types providing unified interface."""
 	
+	__slots__ = ('_type',)
+	
 	def __init__(self, gdb_type):
 		"""Initialize with a GDB type.
 		
@@ -354,6 +394,31 @@ def parse_and_eval(expression):
 	return Value(gdb.parse_and_eval(expression))
 
 
+# Results of expressions which are stable while the inferior is stopped
+_EVAL_CACHE = {}
+register_cache(_EVAL_CACHE.clear)
+
+
+def parse_and_eval_cached(expression):
+	"""Evaluate an expression in the debugger, caching the result.
+	
+	Only use this for expressions whose value cannot change while the inferior
+	is stopped (e.g. global variables, sizeof). The cache is cleared whenever
+	the inferior resumes.
+	
+	Args:
+		expression: Expression string (e.g., "ruby_global_symbols")
+	
+	Returns:
+		Value object representing the result
+	"""
+	value = _EVAL_CACHE.get(expression)
+	if value is None:
+		value = parse_and_eval(expression)
+		_EVAL_CACHE[expression] = value
+	return value
+
+
 def lookup_type(type_name):
 	"""Look up a type by name.
 	
@@ -437,6 +502,31 @@ def get_enum_value(enum_name, member_name):
 	return int(gdb.parse_and_eval(member_name))
 
 
+# The selected inferior, cached between events which may change it
+_CACHED_INFERIOR = None
+
+
+def _inferior():
+	"""Get the selected inferior, caching it until it may have changed.
+	
+	Returns:
+		gdb.Inferior object
+	"""
+	global _CACHED_INFERIOR
+	if _CACHED_INFERIOR is None:
+		_CACHED_INFERIOR = gdb.selected_inferior()
+	return _CACHED_INFERIOR
+
+
+def _reset_inferior():
+	"""Forget the cached inferior."""
+	global _CACHED_INFERIOR
+	_CACHED_INFERIOR = None
+
+
+register_cache(_reset_inferior, events=('new_inferior', 'inferior_deleted', 'stop', 'before_prompt'))
+
+
 def read_memory(address, size):
 	"""Read memory from the debugged process.
 	
@@ -450,17 +540,19 @@ def read_memory(address, size):
 	Raises:
 		MemoryError: If memory cannot be read
 	"""
-	# Convert to integer address if needed
-	if hasattr(address, '__int__'):
-		address = int(address)
+	# Accept Value and gdb.Value addresses as well as integers:
+	address = int(address)
 	
 	try:
-		inferior = gdb.selected_inferior()
-		return inferior.read_memory(address, size).tobytes()
+		return _inferior().read_memory(address, size).tobytes()
 	except gdb.MemoryError as e:
 		raise MemoryError(f"Cannot read {size} bytes at 0x{address:x}: {e}")
 
 
+# Size of the first read in read_cstring, doubled on each subsequent read
+_CSTRING_CHUNK_SIZE = 32
+
+
 def read_cstring(address, max_length=256):
 	"""Read a NUL-terminated C string from memory.
 	
@@ -475,17 +567,26 @@ def read_cstring(address, max_length=256):
 	Raises:
 		MemoryError: If memory cannot be read
 	"""
-	# Convert to integer address if needed
-	if hasattr(address, '__int__'):
-		address = int(address)
+	# Accept Value and gdb.Value addresses as well as integers:
+	address = int(address)
 	
 	try:
-		inferior = gdb.selected_inferior()
-		buffer = inferior.read_memory(address, max_length).tobytes()
-		n = buffer.find(b'\x00')
-		if n == -1:
-			n = max_length
-		return (buffer[:n], n)
+		inferior = _inferior()
+		
+		# Most strings are short, so start with a small read and grow the chunk
+		# size only if no NUL terminator has been found yet:
+		buffer = b''
+		chunk = _CSTRING_CHUNK_SIZE
+		while len(buffer) < max_length:
+			offset = len(buffer)
+			data = inferior.read_memory(address + offset, min(chunk, max_length - offset)).tobytes()
+			n = data.find(b'\x00')
+			if n != -1:
+				return (buffer + data[:n], offset + n)
+			buffer += data
+			chunk *= 2
+		
+		return (buffer, max_length)
 	except gdb.MemoryError as e:
 		raise MemoryError(f"Cannot read memory at 0x{address:x}: {e}")
 
@@ -516,12 +617,14 @@ def create_value(address, value_type):
 		# It's a native gdb.Value, use it directly
 		pass
 	else:
-		# Convert to integer address if needed
-		if hasattr(address, '__int__'):
-			address = int(address)
-		# Create a gdb.Value from the integer
-		address = gdb.Value(address)
-	
+		# Create a gdb.Value from the integer address
+		address_int = int(address)
+		result = gdb.Value(address_int).cast(value_type)
+		
+		# Casting to a pointer type preserves the address, so we already know its integer value:
+		if value_type.code == gdb.TYPE_CODE_PTR:
+			return Value(result, address_int)
+		return Value(result)
 	
 	return Value(address.cast(value_type))
 
@@ -553,7 +656,19 @@ def create_value_from_int(int_value, value_type):
 	
 	# Create a gdb.Value from the integer
 	int_val = gdb.Value(int_value)
-	return Value(int_val.cast(value_type))
+	result = int_val.cast(value_type)
+	
+	# Casting to a pointer or a wide enough integer type (e.g. VALUE) preserves the value, so we already know it:
+	target_type = value_type.strip_typedefs()
+	if target_type.code == gdb.TYPE_CODE_PTR:
+		if 0 <= int_value < (1 << (8 * target_type.sizeof)):
+			return Value(result, int_value)
+	elif target_type.code == gdb.TYPE_CODE_INT:
+		# The value may be signed, so only use the range both signed and unsigned types preserve:
+		if 0 <= int_value < (1 << (8 * target_type.sizeof - 1)):
+			return Value(result, int_value)
+	
+	return Value(result)
 
 
 def create_value_from_address(address, value_type):
@@ -626,6 +741,9 @@ def register(name, handler_class, usage=None, category=COMMAND_USER):
 		
 		def invoke(self, arg, from_tty):
 			"""GDB entry point - parses arguments and delegates to handler."""
+			# Another inferior or core file may have been selected since the last command:
+			_clear_caches()
+			
 			# Create terminal first (needed for help text)
 			import format
 			terminal = format.create_terminal(from_tty)
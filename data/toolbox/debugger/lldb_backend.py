@@ -16,10 +16,39 @@ COMMAND_USER = 1
 Error = RuntimeError  # LLDB doesn't have a specific error type
 MemoryError = RuntimeError  # Map to RuntimeError for now
 
+# Events after which cached process state is invalid
+_STATE_EVENTS = {'cont', 'stop', 'memory_changed', 'before_prompt'}
+
+# Functions which clear caches of process state
+_INVALIDATORS = []
+
+
+def register_cache(clear_function, events=('cont', 'memory_changed', 'before_prompt')):
+	"""Register a function which clears a cache.
+	
+	LLDB has no convenient event hooks for process resume, so caches of process
+	state are cleared at the start of every command invocation instead. Caches
+	which are only invalidated by other events (e.g. 'new_objfile') are kept.
+	
+	Args:
+		clear_function: Callable taking no arguments
+		events: Names of the events which invalidate the cache
+	"""
+	if _STATE_EVENTS.intersection(events):
+		_INVALIDATORS.append(clear_function)
+
+
+def _clear_caches():
+	"""Clear all registered caches of process state."""
+	for clear_function in _INVALIDATORS:
+		clear_function()
+
 
 class Value:
 	"""Wrapper for LLDB values providing unified interface."""
 	
+	__slots__ = ('_value',)
+	
 	def __init__(self, lldb_value):
 		"""Initialize with an LLDB value.
 		
@@ -362,6 +391,8 @@ class Value:
 class Type:
 	"""Wrapper for LLDB types providing unified interface."""
 	
+	__slots__ = ('_type',)
+	
 	def __init__(self, lldb_type):
 		"""Initialize with an LLDB type.
 		
@@ -508,6 +539,31 @@ def parse_and_eval(expression):
 	return Value(result)
 
 
+# Results of expressions which are stable while the process is stopped
+_EVAL_CACHE = {}
+register_cache(_EVAL_CACHE.clear)
+
+
+def parse_and_eval_cached(expression):
+	"""Evaluate an expression in the debugger, caching the result.
+	
+	Only use this for expressions whose value cannot change while the process
+	is stopped (e.g. global variables, sizeof). The cache is cleared at the
+	start of every command.
+	
+	Args:
+		expression: Expression string (e.g., "ruby_global_symbols")
+	
+	Returns:
+		Value object representing the result
+	"""
+	value = _EVAL_CACHE.get(expression)
+	if value is None:
+		value = parse_and_eval(expression)
+		_EVAL_CACHE[expression] = value
+	return value
+
+
 def lookup_type(type_name):
 	"""Look up a type by name.
 	
@@ -952,6 +1008,9 @@ def register(name, handler_class, usage=None, category=COMMAND_USER):
 		
 		def invoke(self, arg, from_tty):
 			"""LLDB entry point - parses arguments and delegates to handler."""
+			# The process may have run since the last command:
+			_clear_caches()
+			
 			# Create terminal first (needed for help text)
 			import format
 			terminal = format.create_terminal(from_tty)
@@ -7,14 +7,6 @@ import sys
 import command
 import constants
 import rvalue
-import rstring
-import rarray
-import rhash
-import rsymbol
-import rstruct
-import rfloat
-import rbignum
-import rbasic
 import format
 
 
@@ -3,6 +3,9 @@ import rbasic
 import constants
 import format
 
+# Number of items read from memory at a time (4KB of 64-bit VALUEs)
+_CHUNK_LENGTH = 512
+
 class RArrayBase:
 	"""Base class for RArray variants."""
 	
@@ -10,8 +13,7 @@ class RArrayBase:
 		"""value is a VALUE pointing to a T_ARRAY object."""
 		self.value = value
 		self.rarray = value.cast(constants.type_struct('struct RArray').pointer())
-		self.basic = value.cast(constants.type_struct('struct RBasic').pointer())
-		self.flags = int(self.basic.dereference()['flags'])
+		self.flags = rbasic.read_flags(value)
 	
 	def length(self):
 		"""Get array length. Must be implemented by subclasses."""
@@ -21,6 +23,17 @@ class RArrayBase:
 		"""Get pointer to array items. Must be implemented by subclasses."""
 		raise NotImplementedError
 	
+	def items_address(self):
+		"""Get the address of the first item. Must be implemented by subclasses."""
+		raise NotImplementedError
+	
+	def items(self, start, count):
+		"""Get count items from index start, reading them from memory in one go."""
+		value_type = constants.type_struct('VALUE')
+		address = self.items_address() + start * value_type.sizeof
+		words = rbasic.read_value_words(address, count)
+		return [debugger.create_value_from_int(word, value_type) for word in words]
+	
 	def get_item(self, index):
 		"""Get item at index."""
 		if index < 0 or index >= self.length():
@@ -47,14 +60,24 @@ class RArrayBase:
 				printer.print_with_indent(printer.max_depth - depth, "  ...")
 			return
 		
-		# Print each element
-		for i in range(len(self)):
-			printer.print_item_label(printer.max_depth - depth, i)
+		# Print each element, reading them in bounded chunks
+		length = len(self)
+		for start in range(0, length, _CHUNK_LENGTH):
+			count = min(_CHUNK_LENGTH, length - start)
 			try:
-				element = self[i]
-				printer.print_value(element, depth - 1)
-			except Exception as e:
-				print(f"Error accessing element {i}: {e}")
+				elements = self.items(start, count)
+			except Exception:
+				# Fall back to reading one at a time, so each failure is reported:
+				elements = None
+			
+			for offset in range(count):
+				i = start + offset
+				printer.print_item_label(printer.max_depth - depth, i)
+				try:
+					element = elements[offset] if elements is not None else self[i]
+					printer.print_value(element, depth - 1)
+				except Exception as e:
+					print(f"Error accessing element {i}: {e}")
 
 class RArrayEmbedded(RArrayBase):
 	"""Embedded array (small arrays stored directly in struct)."""
@@ -69,6 +92,9 @@ class RArrayEmbedded(RArrayBase):
 	def items_ptr(self):
 		return self.rarray.dereference()['as']['ary']
 	
+	def items_address(self):
+		return int(self.items_ptr().address)
+	
 	def __str__(self):
 		"""Return string representation of array."""
 		addr = int(self.value)
@@ -89,6 +115,9 @@ class RArrayHeap(RArrayBase):
 	def items_ptr(self):
 		return self.rarray.dereference()['as']['heap']['ptr']
 	
+	def items_address(self):
+		return int(self.items_ptr())
+	
 	def __str__(self):
 		"""Return string representation of array."""
 		addr = int(self.value)
@@ -106,8 +135,7 @@ def RArray(value):
 	Caller should ensure value is a RUBY_T_ARRAY before calling this function.
 	"""
 	# Get flags to determine embedded vs heap
-	basic = value.cast(constants.type_struct('struct RBasic').pointer())
-	flags = int(basic.dereference()['flags'])
+	flags = rbasic.read_flags(value)
 	
 	# Check if array is embedded or heap-allocated using flags
 	if (flags & constants.get("RARRAY_EMBED_FLAG")) != 0:
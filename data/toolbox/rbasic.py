@@ -1,29 +1,109 @@
+import sys
+
 import debugger
 import constants
 import format
 
-def type_of(value):
+# Cached RUBY_T_MASK value and VALUE size, resolved on first use
+_T_MASK = None
+_VALUE_SIZE = None
+
+# Cache of object address to type flag
+_TYPE_FLAG_CACHE = {}
+debugger.register_cache(_TYPE_FLAG_CACHE.clear)
+
+def _t_mask():
+	"""Get the cached RUBY_T_MASK value, looking it up on first use."""
+	global _T_MASK
+	if _T_MASK is None:
+		_T_MASK = constants.type('RUBY_T_MASK')
+	return _T_MASK
+
+def _clear_type_caches():
+	"""Forget cached types and constants, which may change when symbols are loaded."""
+	global _T_MASK, _VALUE_SIZE, _TYPE_NAME_BY_FLAG
+	_T_MASK = None
+	_VALUE_SIZE = None
+	_TYPE_NAME_BY_FLAG = None
+
+debugger.register_cache(_clear_type_caches, events=('new_objfile',))
+
+def _value_size():
+	"""Get the cached size of VALUE in bytes, looking it up on first use."""
+	global _VALUE_SIZE
+	if _VALUE_SIZE is None:
+		_VALUE_SIZE = constants.type_struct('VALUE').sizeof
+	return _VALUE_SIZE
+
+def read_flags(value):
+	"""Read the RBasic flags of a heap object.
+	
+	`flags` is the first VALUE-sized word of every object, so it is read
+	directly from memory rather than through the debugger's typed value API.
+	
+	Arguments:
+		value: The GDB value of a heap object
+	
+	Returns:
+		The integer flags word
+	
+	Raises:
+		MemoryError: If the value is not a readable heap pointer (e.g. a tagged immediate)
+	"""
+	raw = debugger.read_memory(int(value), _value_size())
+	# Host byte order, which matches the target when debugging natively:
+	return int.from_bytes(raw, sys.byteorder)
+
+def read_value_words(address, count):
+	"""Read consecutive VALUE-sized words from memory in a single read.
+	
+	Arguments:
+		address: Address of the first word (integer or pointer value)
+		count: Number of words to read
+	
+	Returns:
+		List of integers, one per word
+	"""
+	if count <= 0:
+		return []
+	
+	value_size = _value_size()
+	data = debugger.read_values(address, count, value_size)
+	return debugger.unpack_values(data, value_size)
+
+def type_of(value, flags=None):
 	"""Get the Ruby type of a VALUE.
 	
 	Returns the RUBY_T_* constant value (e.g., RUBY_T_STRING, RUBY_T_ARRAY),
 	or None if the type cannot be determined.
+	
+	Arguments:
+		value: The GDB value to check
+		flags: Optional RBasic flags already read for this value, to avoid reading them again
 	"""
-	basic = value.cast(constants.type_struct('struct RBasic').pointer())
-	flags = int(basic.dereference()['flags'])
-	RUBY_T_MASK = constants.type('RUBY_T_MASK')
-	return flags & RUBY_T_MASK
+	if flags is not None:
+		return flags & _t_mask()
+	
+	address = int(value)
+	type_flag = _TYPE_FLAG_CACHE.get(address)
+	if type_flag is None:
+		type_flag = read_flags(value) & _t_mask()
+		_TYPE_FLAG_CACHE[address] = type_flag
+	
+	return type_flag
 
-def is_type(value, ruby_type_constant):
+def is_type(value, ruby_type_constant, flags=None):
 	"""Check if a VALUE is of a specific Ruby type.
 	
 	Arguments:
 		value: The GDB value to check
 		ruby_type_constant: String name of the constant (e.g., 'RUBY_T_STRING')
+		flags: Optional RBasic flags already read for this value
 	
 	Returns:
 		True if the value is of the specified type, False otherwise
 	"""
-	type_flag = type_of(value)
+	type_flag = type_of(value, flags)
 	expected_type = constants.get(ruby_type_constant)
 	return type_flag == expected_type
 
@@ -57,20 +137,54 @@ TYPE_NAMES = {
 	'RUBY_T_ZOMBIE': 'T_ZOMBIE',
 }
 
-def type_name(value):
-	"""Get the human-readable type name for a VALUE.
+# Reverse map of type flag values to display names, built on first use
+_TYPE_NAME_BY_FLAG = None
+
+# Flag values of the most commonly printed types, checked before the map
+_T_STRING = None
+_T_ARRAY = None
+_T_HASH = None
+
+def _type_name_map():
+	"""Get the cached mapping of RUBY_T_* flag values to display names."""
+	global _TYPE_NAME_BY_FLAG, _T_STRING, _T_ARRAY, _T_HASH
+	if _TYPE_NAME_BY_FLAG is None:
+		type_name_by_flag = {}
+		for const_name, display_name in TYPE_NAMES.items():
+			# Keep the first name if two constants share a value:
+			type_name_by_flag.setdefault(constants.type(const_name), display_name)
+		
+		_T_STRING = constants.type('RUBY_T_STRING')
+		_T_ARRAY = constants.type('RUBY_T_ARRAY')
+		_T_HASH = constants.type('RUBY_T_HASH')
+		_TYPE_NAME_BY_FLAG = type_name_by_flag
+	return _TYPE_NAME_BY_FLAG
+
+def type_name_from_flag(type_flag):
+	"""Get the human-readable type name for a RUBY_T_* flag value.
 	
 	Returns:
 		String like 'T_STRING', 'T_ARRAY', 'T_HASH', etc., or 'Unknown(0x...)'
 	"""
-	type_flag = type_of(value)
+	type_name_by_flag = _type_name_map()
+	
+	# Fast path for the most common object types:
+	if type_flag == _T_STRING:
+		return 'T_STRING'
+	if type_flag == _T_ARRAY:
+		return 'T_ARRAY'
+	if type_flag == _T_HASH:
+		return 'T_HASH'
 	
-	# Try to find matching type name
-	for const_name, display_name in TYPE_NAMES.items():
-		if constants.get(const_name) == type_flag:
-			return display_name
+	return type_name_by_flag.get(type_flag, f'Unknown(0x{type_flag:x})')
+
+def type_name(value):
+	"""Get the human-readable type name for a VALUE.
 	
-	return f'Unknown(0x{type_flag:x})'
+	Returns:
+		String like 'T_STRING', 'T_ARRAY', 'T_HASH', etc., or 'Unknown(0x...)'
+	"""
+	return type_name_from_flag(type_of(value))
 
 class RBasic:
 	"""Generic Ruby object wrapper for unhandled types.
@@ -79,21 +193,33 @@ class RBasic:
 	"""
 	def __init__(self, value):
 		self.value = value
-		self.basic = value.cast(constants.type_struct('struct RBasic').pointer())
-		self.flags = int(self.basic.dereference()['flags'])
-		self.type_flag = self.flags & constants.type('RUBY_T_MASK')
+		self.address = int(value)
+		self.flags = read_flags(value)
+		self.type_flag = type_of(value, self.flags)
 	
 	def __str__(self):
-		type_str = type_name(self.value)
-		return f"<{type_str}@0x{int(self.value):x}>"
+		type_str = type_name_from_flag(self.type_flag)
+		return f"<{type_str}@0x{self.address:x}>"
 	
 	def print_to(self, terminal):
 		"""Print formatted basic object representation."""
-		type_str = type_name(self.value)
-		addr = int(self.value)
+		type_str = type_name_from_flag(self.type_flag)
+		addr = self.address
 		# Use print_type_tag for consistency with other types
 		terminal.print_type_tag(type_str, addr)
 	
 	def print_recursive(self, printer, depth):
 		"""Print this basic object (no recursion)."""
 		printer.print(self)
+
+# Factories for wrapping heap objects, keyed by RUBY_T_* type flag
+HANDLERS = {}
+
+def register_handler(type_flag, factory):
+	"""Register the factory used to wrap heap objects of a given type.
+	
+	Arguments:
+		type_flag: A RUBY_T_* type flag value (e.g. constants.type('RUBY_T_STRING'))
+		factory: Callable taking a VALUE and returning a wrapper with print_recursive()
+	"""
+	HANDLERS[type_flag] = factory
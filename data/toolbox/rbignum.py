@@ -7,8 +7,7 @@ class RBignumObject:
 	def __init__(self, value):
 		self.value = value
 		self.rbignum = value.cast(constants.type_struct('struct RBignum').pointer())
-		self.basic = value.cast(constants.type_struct('struct RBasic').pointer())
-		self.flags = int(self.basic.dereference()['flags'])
+		self.flags = rbasic.read_flags(value)
 	
 	def is_embedded(self):
 		# Check if FL_USER1 flag is set (RBIGNUM_EMBED_FLAG)
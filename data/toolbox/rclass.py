@@ -77,7 +77,7 @@ class RClass:
 			klass_addr = int(self.klass)
 			for var_name, class_name in well_known:
 				try:
-					known_klass = debugger.parse_and_eval(var_name)
+					known_klass = debugger.parse_and_eval_cached(var_name)
 					if int(known_klass) == klass_addr:
 						return class_name
 				except:
@@ -90,7 +90,7 @@ class RClass:
 				# Try to access classext.classpath
 				try:
 					# Try embedded classext (RCLASS_EXT_EMBEDDED)
-					rclass_size = debugger.parse_and_eval("sizeof(struct RClass)")
+					rclass_size = debugger.parse_and_eval_cached("sizeof(struct RClass)")
 					classext_addr = int(self.klass) + int(rclass_size)
 					classext_type = constants.type_struct('rb_classext_t')
 					classext_ptr = debugger.create_value_from_address(classext_addr, classext_type).address
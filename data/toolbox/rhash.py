@@ -3,6 +3,9 @@ import rbasic
 import constants
 import format
 
+# Number of ST table entries read from memory at a time
+_CHUNK_ENTRIES = 256
+
 class RHashBase:
 	"""Base class for RHash variants."""
 	
@@ -10,8 +13,7 @@ class RHashBase:
 		"""value is a VALUE pointing to a T_HASH object."""
 		self.value = value
 		self.rhash = value.cast(constants.type_struct('struct RHash').pointer())
-		self.basic = value.cast(constants.type_struct('struct RBasic').pointer())
-		self.flags = int(self.basic.dereference()['flags'])
+		self.flags = rbasic.read_flags(value)
 	
 	def size(self):
 		"""Get hash size. Must be implemented by subclasses."""
@@ -27,7 +29,7 @@ class RHashSTTable(RHashBase):
 	def __init__(self, value):
 		super().__init__(value)
 		# Calculate st_table pointer
-		rhash_size = debugger.parse_and_eval("sizeof(struct RHash)")
+		rhash_size = debugger.parse_and_eval_cached("sizeof(struct RHash)")
 		st_table_addr = int(value) + int(rhash_size)
 		st_table_type = constants.type_struct("st_table")
 		self.st_table = debugger.create_value_from_address(st_table_addr, st_table_type).address
@@ -38,10 +40,19 @@ class RHashSTTable(RHashBase):
 	def pairs(self):
 		"""Yield (key, value) pairs."""
 		num_entries = self.size()
-		for i in range(num_entries):
-			key = self.st_table.dereference()['entries'][i]['key']
-			value = self.st_table.dereference()['entries'][i]['record']
-			yield (key, value)
+		entries_address = int(self.st_table.dereference()['entries'])
+		
+		# Each st_table_entry is {hash, key, record}, read in bounded chunks:
+		value_type = constants.type_struct('VALUE')
+		entry_size = constants.type_struct('st_table_entry').sizeof
+		entry_words = entry_size // value_type.sizeof
+		for start in range(0, num_entries, _CHUNK_ENTRIES):
+			count = min(_CHUNK_ENTRIES, num_entries - start)
+			words = rbasic.read_value_words(entries_address + start * entry_size, count * entry_words)
+			for i in range(0, len(words), entry_words):
+				key = debugger.create_value_from_int(words[i + 1], value_type)
+				value = debugger.create_value_from_int(words[i + 2], value_type)
+				yield (key, value)
 	
 	def __str__(self):
 		"""Return string representation of hash."""
@@ -83,7 +94,7 @@ class RHashARTable(RHashBase):
 			self.ar_table = as_union['ar']
 		else:
 			# Ruby 3.3+: ar_table is embedded directly after RHash structure
-			rhash_size = debugger.parse_and_eval("sizeof(struct RHash)")
+			rhash_size = debugger.parse_and_eval_cached("sizeof(struct RHash)")
 			ar_table_addr = int(self.rhash) + int(rhash_size)
 			ar_table_type = constants.type_struct("struct ar_table_struct")
 			self.ar_table = debugger.create_value_from_address(ar_table_addr, ar_table_type).address
@@ -102,11 +113,16 @@ class RHashARTable(RHashBase):
 	def pairs(self):
 		"""Yield (key, value) pairs, skipping undefined/deleted entries."""
 		RUBY_Qundef = constants.get("RUBY_Qundef")
-		for i in range(int(self.ar_bound)):
-			key = self.ar_table.dereference()['pairs'][i]['key']
+		pairs = self.ar_table.dereference()['pairs']
+		
+		# Each ar_table_pair is {key, val}, so read them all at once:
+		words = rbasic.read_value_words(int(pairs.address), int(self.ar_bound) * 2)
+		value_type = constants.type_struct('VALUE')
+		for i in range(0, len(words), 2):
 			# Skip undefined/deleted entries
-			if int(key) != RUBY_Qundef:
-				value = self.ar_table.dereference()['pairs'][i]['val']
+			if words[i] != RUBY_Qundef:
+				key = debugger.create_value_from_int(words[i], value_type)
+				value = debugger.create_value_from_int(words[i + 1], value_type)
 				yield (key, value)
 	
 	def __str__(self):
@@ -142,8 +158,7 @@ def RHash(value):
 	Caller should ensure value is a RUBY_T_HASH before calling this function.
 	"""
 	# Get flags to determine ST table vs AR table
-	basic = value.cast(constants.type_struct('struct RBasic').pointer())
-	flags = int(basic.dereference()['flags'])
+	flags = rbasic.read_flags(value)
 	
 	if (flags & constants.get("RHASH_ST_TABLE_FLAG")) != 0:
 		return RHashSTTable(value)
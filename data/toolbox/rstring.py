@@ -17,8 +17,7 @@ class RStringBase:
 		"""value is a VALUE pointing to a T_STRING object."""
 		self.value = value
 		self.rstring = value.cast(constants.type_struct('struct RString').pointer())
-		self.basic = value.cast(constants.type_struct('struct RBasic').pointer())
-		self.flags = int(self.basic.dereference()['flags'])
+		self.flags = rbasic.read_flags(value)
 	
 	def _is_embedded(self):
 		"""Check if string is embedded. Must be implemented by subclasses."""
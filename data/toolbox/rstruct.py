@@ -39,7 +39,7 @@ class RStructEmbedded(RStructBase):
 	
 	def length(self):
 		"""Get length from flags for embedded struct."""
-		flags = int(self.rstruct.dereference()['basic']['flags'])
+		flags = rbasic.read_flags(self.value)
 		
 		# Extract length from FL_USER1 and FL_USER2 flags
 		RUBY_FL_USER1 = constants.flag("RUBY_FL_USER1")
@@ -129,7 +129,7 @@ def RStruct(value):
 	# Cast to RStruct pointer to read flags
 	rstruct_type = constants.type_struct("struct RStruct").pointer()
 	rstruct = value.cast(rstruct_type)
-	flags = int(rstruct.dereference()['basic']['flags'])
+	flags = rbasic.read_flags(value)
 	
 	# Feature detection: check for RSTRUCT_EMBED_LEN_MASK flag
 	# If struct uses embedded storage, the length is encoded in flags
@@ -45,7 +45,7 @@ class RubySymbol:
 				serial = id_val
 			
 			# Access ruby_global_symbols
-			global_symbols = debugger.parse_and_eval("ruby_global_symbols")
+			global_symbols = debugger.parse_and_eval_cached("ruby_global_symbols")
 			
 			# Ruby 3.5+ changed from last_id to next_id
 			last_id_field = global_symbols['last_id']
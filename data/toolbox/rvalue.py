@@ -1,4 +1,5 @@
-import sys
+import importlib
+
 import constants
 import format
 
@@ -6,11 +7,18 @@ import format
 import rbasic
 import rfloat
 import rsymbol
-import rstring
-import rarray
-import rhash
-import rstruct
-import rbignum
+
+# Wrappers for heap object types, as (module, factory) names so that each
+# module is only imported the first time an object of that type is seen
+_HANDLER_NAMES = {
+	'RUBY_T_STRING': ('rstring', 'RString'),
+	'RUBY_T_ARRAY': ('rarray', 'RArray'),
+	'RUBY_T_HASH': ('rhash', 'RHash'),
+	'RUBY_T_STRUCT': ('rstruct', 'RStruct'),
+	'RUBY_T_SYMBOL': ('rsymbol', 'RSymbol'),
+	'RUBY_T_FLOAT': ('rfloat', 'RFloat'),
+	'RUBY_T_BIGNUM': ('rbignum', 'RBignum'),
+}
 
 class RImmediate:
 	"""Wrapper for Ruby immediate values (fixnum, nil, true, false)."""
@@ -109,9 +117,7 @@ def is_exception(value):
 	
 	try:
 		# Check if it's a T_OBJECT or T_DATA (exceptions can be either)
-		basic = value.cast(constants.type_struct("struct RBasic").pointer())
-		flags = int(basic.dereference()['flags'])
-		type_flag = flags & constants.type("RUBY_T_MASK")
+		type_flag = rbasic.type_of(value)
 		
 		# Exceptions are typically T_OBJECT, but could also be T_DATA
 		# We can't reliably determine if it's an exception without checking the class hierarchy
@@ -123,6 +129,24 @@ def is_exception(value):
 	except Exception:
 		return False
 
+def _load_handler(type_flag):
+	"""Import and register the factory for heap objects with the given type flag.
+	
+	Arguments:
+		type_flag: A RUBY_T_* type flag value
+	
+	Returns:
+		A callable taking a VALUE, falling back to rbasic.RBasic for unhandled types
+	"""
+	handler = rbasic.RBasic
+	for const_name, (module_name, factory_name) in _HANDLER_NAMES.items():
+		if constants.type(const_name) == type_flag:
+			handler = getattr(importlib.import_module(module_name), factory_name)
+			break
+	
+	rbasic.register_handler(type_flag, handler)
+	return handler
+
 def interpret(value):
 	"""Interpret a Ruby VALUE and return the appropriate typed object.
 	
@@ -155,29 +179,11 @@ def interpret(value):
 	
 	# It's a heap object, examine its type
 	try:
-		basic = value.cast(constants.type_struct("struct RBasic").pointer())
-		flags = int(basic.dereference()['flags'])
-		type_flag = flags & constants.type("RUBY_T_MASK")
-		
-		# Map type flags to their corresponding factory functions
-		if type_flag == constants.type("RUBY_T_STRING"):
-			return rstring.RString(value)
-		elif type_flag == constants.type("RUBY_T_ARRAY"):
-			return rarray.RArray(value)
-		elif type_flag == constants.type("RUBY_T_HASH"):
-			return rhash.RHash(value)
-		elif type_flag == constants.type("RUBY_T_STRUCT"):
-			return rstruct.RStruct(value)
-		elif type_flag == constants.type("RUBY_T_SYMBOL"):
-			return rsymbol.RSymbol(value)
-		elif type_flag == constants.type("RUBY_T_FLOAT"):
-			return rfloat.RFloat(value)
-		elif type_flag == constants.type("RUBY_T_BIGNUM"):
-			return rbignum.RBignum(value)
-		else:
-			# Unknown type - return generic RBasic
-			return rbasic.RBasic(value)
-	except Exception as e:
+		type_flag = rbasic.type_of(value)
+		handler = rbasic.HANDLERS.get(type_flag)
+		if handler is None:
+			handler = _load_handler(type_flag)
+		return handler(value)
+	except Exception:
 		# If we can't examine it, return a generic wrapper
-		print(f"DEBUG interpret: exception {e}, returning RBasic", file=sys.stderr)
 		return rbasic.RBasic(value)
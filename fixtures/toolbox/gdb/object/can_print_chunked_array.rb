@@ -0,0 +1,11 @@
+# frozen_string_literal: true
+
+# Released under the MIT License.
+# Copyright, 2025, by Samuel Williams.
+
+# Longer than a single chunk (512 items), so the items are read in several chunks:
+array = Array.new(1000) {|i| i}
+
+# Pass the array directly to puts (not .inspect)
+# This way the array VALUE is the argument to rb_f_puts
+puts array
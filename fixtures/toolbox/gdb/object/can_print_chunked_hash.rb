@@ -0,0 +1,11 @@
+# frozen_string_literal: true
+
+# Released under the MIT License.
+# Copyright, 2025, by Samuel Williams.
+
+# More entries than a single chunk (256 entries), so the ST table is read in several chunks:
+hash = (0...300).to_h {|i| [i, i * 2]}
+
+# Pass the hash directly to puts (not .inspect)
+# This way the hash VALUE is the argument to rb_f_puts
+puts hash
@@ -0,0 +1,11 @@
+# frozen_string_literal: true
+
+# Released under the MIT License.
+# Copyright, 2025, by Samuel Williams.
+
+# Small enough to be embedded directly in the RArray:
+array = [1, 2, 3]
+
+# Pass the array directly to puts (not .inspect)
+# This way the array VALUE is the argument to rb_f_puts
+puts array
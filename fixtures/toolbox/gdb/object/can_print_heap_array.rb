@@ -0,0 +1,11 @@
+# frozen_string_literal: true
+
+# Released under the MIT License.
+# Copyright, 2025, by Samuel Williams.
+
+# Too large to be embedded, so the items are stored in a separate heap allocation:
+array = Array.new(100) {|i| i}
+
+# Pass the array directly to puts (not .inspect)
+# This way the array VALUE is the argument to rb_f_puts
+puts array
@@ -0,0 +1,11 @@
+# frozen_string_literal: true
+
+# Released under the MIT License.
+# Copyright, 2025, by Samuel Williams.
+
+# More than 8 entries, so the hash is stored in an ST table rather than an AR table:
+hash = {a: 1, b: 2, c: 3, d: 4, e: 5, f: 6, g: 7, h: 8, i: 9, j: 10}
+
+# Pass the hash directly to puts (not .inspect)
+# This way the hash VALUE is the argument to rb_f_puts
+puts hash